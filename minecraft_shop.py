@@ -2,85 +2,258 @@ import tkinter as tk
 from tkinter import ttk, messagebox
 from discord_webhook import DiscordWebhook
 import requests
+from requests.adapters import HTTPAdapter
 import csv
-from io import StringIO
+import json
+import atexit
 import os
 import sys
+import threading
+import queue
+import random
+import time
+import itertools
+import functools
 from PIL import Image, ImageTk
 
 DISCORD_WEBHOOK_URL = "https://discord.com/api/webhooks/1426471170437550162/rEwrlOkvyX38VSzOaWBu3AM-tXsinIhf-kHfQc9K2VWTC0BWywR6V-MMNJRt633Ytm3"
 SHEET_ID = "1MxjocKFqa4Chv9HHiOeom3LlGLbdicZXaR_41arPEkk"
+PRICE_CACHE_FILE = "prices_cache.json"
+PENDING_ORDERS_FILE = "pending_orders.json"
+ITEM_BATCH_SIZE = 20
 
 prices = {}
 selected_item = None
-item_buttons = []
+selected_button = None
+item_buttons = {}
+last_prices = {}
+item_frame = None
 quantity_entry = None
 total_label = None
+_update_after_id = None
+_last_total_key = None
+_last_total_text = None
 money_supply = 0
+fetch_queue = queue.Queue()
+fetching = False
+sheet_etag = None
+sheet_last_modified = None
+_webhook_q = queue.Queue()
+_webhook_inflight = None
+_webhook_failed = []
+
+SESSION = requests.Session()
+SESSION.headers.update({"Accept-Encoding": "gzip"})
+SESSION.mount("https://", HTTPAdapter(pool_connections=1, pool_maxsize=1))
+
+RETRY_STATUSES = {429, 500, 502, 503, 504}
 
 def resource_path(relative_path):
     if hasattr(sys, "_MEIPASS"):
         return os.path.join(sys._MEIPASS, relative_path)
     return os.path.join(os.path.abspath("."), relative_path)
 
+def retry_after_seconds(response):
+    try:
+        return float(response.headers.get("Retry-After", ""))
+    except (AttributeError, ValueError):
+        return None
+
+def with_retry(fn, attempts=3, base=1.0, cap=30.0):
+    for attempt in range(attempts):
+        last_attempt = attempt == attempts - 1
+        try:
+            response = fn()
+        except requests.exceptions.RequestException as e:
+            if last_attempt:
+                raise
+            print("Request failed, retrying:", e)
+            delay = None
+        else:
+            if getattr(response, "status_code", None) not in RETRY_STATUSES or last_attempt:
+                return response
+            print("Got HTTP", response.status_code, "retrying")
+            delay = retry_after_seconds(response)
+            response.close()
+        if delay is None:
+            delay = random.uniform(0, min(cap, base * 2 ** attempt))
+        time.sleep(min(cap, delay))
+
 def fetch_prices_from_sheet():
-    global prices, money_supply
+    global sheet_etag, sheet_last_modified
     try:
         url = f"https://docs.google.com/spreadsheets/d/{SHEET_ID}/export?format=csv"
-        response = requests.get(url)
-        response.raise_for_status()
-        f = StringIO(response.text)
-        lines = f.readlines()
-        try:
-            money_supply = int(lines[0].split()[-1])
-        except Exception:
-            money_supply = 0
-        reader = csv.DictReader(lines[1:])
-        prices = {row['Item']: int(row['AdjustedPrice']) for row in reader}
-        print("Prices fetched:", prices)
+        headers = {}
+        if prices and sheet_etag:
+            headers["If-None-Match"] = sheet_etag
+        if prices and sheet_last_modified:
+            headers["If-Modified-Since"] = sheet_last_modified
+        with with_retry(lambda: SESSION.get(url, headers=headers, timeout=(3, 10), stream=True)) as response:
+            if response.status_code == 304:
+                print("Prices unchanged")
+                return prices, money_supply
+            response.raise_for_status()
+            etag = response.headers.get("ETag")
+            last_modified = response.headers.get("Last-Modified")
+            if response.encoding is None:
+                response.encoding = "utf-8"
+            lines = response.iter_lines(decode_unicode=True)
+            try:
+                new_money_supply = int(next(lines, "").split()[-1])
+            except Exception:
+                new_money_supply = 0
+            reader = csv.reader(lines)
+            header = next(reader, [])
+            item_idx = header.index('Item')
+            price_idx = header.index('AdjustedPrice')
+            new_prices = {}
+            _int = int
+            for row in reader:
+                try:
+                    new_prices[row[item_idx]] = _int(row[price_idx])
+                except (ValueError, IndexError):
+                    continue
+        print("Prices fetched:", new_prices)
+        sheet_etag = etag
+        sheet_last_modified = last_modified
+        save_price_cache(new_prices, new_money_supply)
+        return new_prices, new_money_supply
     except requests.exceptions.RequestException as e:
         print("Error fetching sheet:", e)
-        prices = {}
-    except KeyError as e:
-        print("KeyError while reading CSV:", e)
+    except ValueError as e:
+        print("Error while reading CSV:", e)
         print("Check your sheet headers: should be 'Item', 'BasePrice', 'AdjustedPrice'")
-        prices = {}
+    return prices, money_supply
+
+def load_cached_prices():
+    global prices, money_supply, sheet_etag, sheet_last_modified
+    try:
+        with open(PRICE_CACHE_FILE, "r") as f:
+            cache = json.load(f)
+        if cache.get("sheet_id") != SHEET_ID:
+            return False
+        cached_prices = {item: int(price) for item, price in cache["prices"].items()}
+        cached_money_supply = int(cache.get("money_supply", 0))
+    except FileNotFoundError:
+        return False
+    except (OSError, ValueError, KeyError, AttributeError, TypeError) as e:
+        print("Error reading price cache:", e)
+        return False
+    if not cached_prices:
+        return False
+    prices = cached_prices
+    money_supply = cached_money_supply
+    sheet_etag = cache.get("etag")
+    sheet_last_modified = cache.get("last_modified")
+    print("Prices loaded from cache:", prices)
+    return True
+
+def save_price_cache(new_prices, new_money_supply):
+    if not new_prices:
+        return
+    cache = {
+        "sheet_id": SHEET_ID,
+        "etag": sheet_etag,
+        "last_modified": sheet_last_modified,
+        "money_supply": new_money_supply,
+        "prices": new_prices,
+    }
+    try:
+        with open(PRICE_CACHE_FILE, "w") as f:
+            json.dump(cache, f)
+    except OSError as e:
+        print("Error writing price cache:", e)
+
+def _fetch_worker():
+    result = (prices, money_supply)
+    try:
+        result = fetch_prices_from_sheet()
+    finally:
+        fetch_queue.put(result)
+
+def start_fetch(widget, on_done):
+    global fetching
+    if fetching:
+        return
+    fetching = True
+    threading.Thread(target=_fetch_worker, daemon=True).start()
+    widget.after(50, drain_fetch_queue, widget, on_done)
+
+def drain_fetch_queue(widget, on_done):
+    global fetching
+    try:
+        new_prices, new_money_supply = fetch_queue.get_nowait()
+    except queue.Empty:
+        widget.after(50, drain_fetch_queue, widget, on_done)
+        return
+    fetching = False
+    apply_prices(new_prices, new_money_supply)
+    on_done()
+
+def apply_prices(new_prices, new_money_supply):
+    global prices, money_supply
+    prices = new_prices
+    money_supply = new_money_supply
 
 def select_item(item, button):
-    global selected_item
-    for btn in item_buttons:
-        btn.config(bg="SystemButtonFace")
+    global selected_item, selected_button
+    if selected_button is not None:
+        selected_button.config(bg="SystemButtonFace")
+    selected_button = button
     button.config(bg="lightgreen")
     selected_item = item
     update_total()
 
+def select_item_by_widget(button):
+    select_item(button.item_name, button)
+
 def clear_selection():
-    global selected_item
+    global selected_item, selected_button, _last_total_key, _last_total_text
     selected_item = None
-    for btn in item_buttons:
-        btn.config(bg="SystemButtonFace")
-    if total_label:
+    _last_total_key = None
+    if selected_button is not None:
+        selected_button.config(bg="SystemButtonFace")
+        selected_button = None
+    if total_label and _last_total_text != "Total: $0":
         total_label.config(text="Total: $0")
+        _last_total_text = "Total: $0"
+
+def schedule_update_total(*args):
+    global _update_after_id
+    if _update_after_id:
+        quantity_entry.after_cancel(_update_after_id)
+    _update_after_id = quantity_entry.after(60, _do_update_total)
+
+def _do_update_total():
+    global _update_after_id
+    _update_after_id = None
+    update_total()
 
 def update_total(*args):
+    global _last_total_key, _last_total_text
     if not selected_item or total_label is None:
         return
-    qty = quantity_entry.get().strip()
-    if qty.isdigit() and int(qty) > 0:
-        total = prices[selected_item] * int(qty)
-        total_label.config(text=f"Total: ${prices[selected_item]} × {qty} = ${total}")
-    else:
-        total_label.config(text=f"Total: ${prices[selected_item]} × 0 = $0")
+    qty = quantity_entry.get()
+    key = (selected_item, prices[selected_item], qty)
+    if key == _last_total_key:
+        return
+    _last_total_key = key
+    n = int(qty) if qty else 0
+    total = prices[selected_item] * n
+    new_text = f"Total: ${prices[selected_item]} × {n} = ${total}"
+    if new_text != _last_total_text:
+        total_label.config(text=new_text)
+        _last_total_text = new_text
 
 def place_order():
     if not selected_item:
         messagebox.showerror("Error", "Please select an item first!")
         return
-    quantity = quantity_entry.get().strip()
-    if not quantity.isdigit() or int(quantity) <= 0:
+    qty = quantity_entry.get()
+    quantity = int(qty) if qty else 0
+    if quantity <= 0:
         messagebox.showerror("Error", "Please enter a valid number for quantity!")
         return
-    quantity = int(quantity)
     total_cost = prices[selected_item] * quantity
     message = f"Order from {player_name.get()}:\n- Item: {selected_item}\n- Amount: {quantity}\n- Total Cost: ${total_cost}"
     log_purchase(message)
@@ -88,30 +261,123 @@ def place_order():
     messagebox.showinfo("Order Placed", "Your order has been sent to Discord!")
 
 def log_purchase(msg):
-    with open("purchases.log", "a") as f:
-        f.write(msg + "\n")
+    PURCHASE_LOG.write(msg + "\n")
     print(msg)
 
 def send_discord(msg):
-    webhook = DiscordWebhook(url=DISCORD_WEBHOOK_URL, content=msg)
-    webhook.execute()
+    _webhook_q.put(msg)
+
+def _webhook_worker():
+    global _webhook_inflight
+    while True:
+        msg = _webhook_q.get()
+        _webhook_inflight = msg
+        try:
+            response = with_retry(DiscordWebhook(url=DISCORD_WEBHOOK_URL, content=msg).execute)
+            if not getattr(response, "ok", True):
+                raise requests.exceptions.HTTPError(f"HTTP {response.status_code}")
+        except Exception as e:
+            print("Error sending to Discord:", e)
+            _webhook_failed.append(msg)
+        finally:
+            _webhook_inflight = None
+
+def save_pending_orders():
+    pending = list(_webhook_failed)
+    if _webhook_inflight is not None:
+        pending.append(_webhook_inflight)
+    pending.extend(_webhook_q.queue)
+    if not pending:
+        return
+    try:
+        with open(PENDING_ORDERS_FILE, "w") as f:
+            json.dump(pending, f)
+    except OSError as e:
+        print("Error saving pending orders:", e)
+
+def load_pending_orders():
+    try:
+        with open(PENDING_ORDERS_FILE, "r") as f:
+            pending = json.load(f)
+        os.remove(PENDING_ORDERS_FILE)
+    except FileNotFoundError:
+        return
+    except (OSError, ValueError) as e:
+        print("Error reading pending orders:", e)
+        return
+    for msg in pending:
+        _webhook_q.put(msg)
+
+def make_item_button(parent, item, price, text):
+    frame = tk.Frame(parent, relief="ridge", borderwidth=2, padx=5, pady=5)
+    btn = tk.Button(frame, text=text)
+    btn.item_name = item
+    btn.config(command=functools.partial(select_item_by_widget, btn))
+    btn.pack(fill="x")
+    item_buttons[item] = btn
+    last_prices[item] = price
+    return frame
+
+def layout_item_buttons(start=0):
+    item_frame.grid_propagate(False)
+    for i, btn in enumerate(itertools.islice(item_buttons.values(), start, None), start):
+        btn.master.grid(row=i // 2, column=i % 2, padx=10, pady=5, sticky="nsew")
+    item_frame.grid_propagate(True)
+    item_frame.update_idletasks()
+
+def build_item_batch(pending, start):
+    _prices = prices
+    _buttons = item_buttons
+    _make = make_item_button
+    parent = item_frame
+    first_new = len(_buttons)
+    items = [(i, _prices[i]) for i in pending[start:start + ITEM_BATCH_SIZE]
+             if i in _prices and i not in _buttons]
+    texts = [f"{i} (${p})" for i, p in items]
+    for (item, price), text in zip(items, texts):
+        _make(parent, item, price, text)
+    layout_item_buttons(first_new)
+    start += ITEM_BATCH_SIZE
+    if start < len(pending):
+        item_frame.after_idle(build_item_batch, pending, start)
 
 def refresh_buttons():
-    for btn in item_buttons:
-        item_name = btn.cget("text").split(" ($")[0]
-        if item_name in prices:
-            btn.config(text=f"{item_name} (${prices[item_name]})")
+    if selected_item is not None and selected_item not in prices:
+        clear_selection()
+    _prices = prices
+    _buttons = item_buttons
+    _last = last_prices
+    removed = [name for name in _buttons if name not in _prices]
+    for name in removed:
+        _buttons.pop(name).master.destroy()
+        del _last[name]
+    first_new = len(_buttons)
+    for name, p in _prices.items():
+        if name not in _buttons:
+            make_item_button(item_frame, name, p, f"{name} (${p})")
+        elif _last.get(name) != p:
+            _buttons[name].config(text=f"{name} (${p})")
+            _last[name] = p
+    if removed:
+        layout_item_buttons()
+    elif len(_buttons) > first_new:
+        layout_item_buttons(first_new)
     update_total()
 
 def login():
     if player_name.get().strip() == "":
         messagebox.showerror("Error", "Please enter your name")
         return
+    if load_cached_prices():
+        enter_shop(revalidate=True)
+    else:
+        start_fetch(login_window, enter_shop)
+
+def enter_shop(revalidate=False):
     login_window.destroy()
-    fetch_prices_from_sheet()
-    open_shop()
+    open_shop(revalidate)
 
-def open_shop():
+def open_shop(revalidate=False):
     shop = tk.Tk()
     shop.title("Minecraft Shop")
     shop.geometry("350x550")
@@ -145,37 +411,32 @@ def open_shop():
     scrollbar.pack(side="right", fill="y")
 
     def _on_mousewheel(event):
-        canvas.yview_scroll(-1 * int(event.delta / 120), "units")
-    canvas.bind_all("<MouseWheel>", _on_mousewheel)
-
-    global item_buttons
-    item_buttons = []
+        if not event.delta:
+            return
+        step = -1 * int(event.delta / 120) or (-1 if event.delta > 0 else 1)
+        canvas.yview_scroll(step, "units")
+    canvas.bind("<Enter>", lambda e: canvas.bind_all("<MouseWheel>", _on_mousewheel))
+    canvas.bind("<Leave>", lambda e: canvas.unbind_all("<MouseWheel>"))
 
-    row = 0
-    col = 0
-    for item, price in prices.items():
-        frame = tk.Frame(scrollable_frame, relief="ridge", borderwidth=2, padx=5, pady=5)
-        frame.grid(row=row, column=col, padx=10, pady=5, sticky="nsew")
+    global item_buttons, last_prices, item_frame
+    item_buttons = {}
+    last_prices = {}
+    item_frame = scrollable_frame
 
-        btn = tk.Button(frame, text=f"{item} (${price})")
-        btn.config(command=lambda i=item, b=btn: select_item(i, b))
-        btn.pack(fill="x")
-        item_buttons.append(btn)
+    scrollable_frame.update_idletasks()
+    build_item_batch(list(prices), 0)
 
-        col += 1
-        if col >= 2:
-            col = 0
-            row += 1
-
-    tk.Button(shop_tab, text="Refresh Prices", command=lambda: [fetch_prices_from_sheet(), refresh_buttons()]).pack(pady=5)
+    tk.Button(shop_tab, text="Refresh Prices", command=lambda: start_fetch(shop, refresh_buttons)).pack(pady=5)
     tk.Label(shop_tab, text="Enter Quantity:", font=("Arial", 12)).pack(pady=5)
 
     global quantity_entry
-    quantity_entry = tk.Entry(shop_tab)
+    vcmd = (shop.register(lambda P: P == "" or P.isdecimal()), "%P")
+    quantity_entry = tk.Entry(shop_tab, validate="key", validatecommand=vcmd)
     quantity_entry.pack(pady=5)
-    quantity_entry.bind("<KeyRelease>", update_total)
+    quantity_entry.bind("<KeyRelease>", schedule_update_total)
 
-    global total_label
+    global total_label, _last_total_text
+    _last_total_text = "Total: $0"
     total_label = tk.Label(shop_tab, text="Total: $0", font=("Arial", 12), fg="blue")
     total_label.pack(pady=5)
 
@@ -183,8 +444,16 @@ def open_shop():
     tk.Button(shop_tab, text="Clear Selection", command=clear_selection).pack(pady=5)
     tk.Label(empty_tab, text="Test", font=("Arial", 14)).pack(pady=20)
 
+    if revalidate:
+        start_fetch(shop, refresh_buttons)
     shop.mainloop()
 
+PURCHASE_LOG = open("purchases.log", "a", buffering=1)
+atexit.register(PURCHASE_LOG.close)
+load_pending_orders()
+threading.Thread(target=_webhook_worker, daemon=True).start()
+atexit.register(save_pending_orders)
+
 login_window = tk.Tk()
 login_window.title("Login")
 login_window.geometry("300x150")
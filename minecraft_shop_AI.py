@@ -5,25 +5,26 @@ A GUI application for managing Minecraft item purchases with Discord integration
 """
 
 import tkinter as tk
-from tkinter import ttk, messagebox, scrolledtext
+from tkinter import ttk, messagebox, scrolledtext, font as tkfont
 import requests
 import csv
-from io import StringIO
 import os
 import sys
 import logging
-from typing import Dict, Optional, List
+import logging.handlers
+import threading
+import queue
+from typing import Callable, Dict, Optional, List, Mapping, Tuple
+from types import MappingProxyType
 from dataclasses import dataclass
 from pathlib import Path
+from collections import deque
+from functools import lru_cache, partial
+from concurrent.futures import Future, ThreadPoolExecutor
 import json
-from datetime import datetime
-
-try:
-    from discord_webhook import DiscordWebhook
-    DISCORD_AVAILABLE = True
-except ImportError:
-    DISCORD_AVAILABLE = False
-    print("Warning: discord-webhook not installed. Discord integration disabled.")
+import time
+import importlib.util
+from datetime import datetime, timedelta
 
 try:
     from PIL import Image, ImageTk
@@ -32,6 +33,10 @@ except ImportError:
     PIL_AVAILABLE = False
     print("Warning: Pillow not installed. Icon functionality disabled.")
 
+# pandas is an optional speed-up for very large sheets. Only check that it is
+# installed here; the (slow) import happens on the fetch thread when first needed.
+PANDAS_AVAILABLE = importlib.util.find_spec("pandas") is not None
+
 
 @dataclass
 class Config:
@@ -40,9 +45,47 @@ class Config:
     sheet_id: str = "1MxjocKFqa4Chv9HHiOeom3LlGLbdicZXaR_41arPEkk"
     log_file: str = "purchases.log"
     config_file: str = "config.json"
+    cache_file: str = "prices_cache.json"
+    pending_file: str = "pending_orders.json"  # Discord messages not delivered before exit
+    log_tail_bytes: int = 256 * 1024  # How much of the log the viewer loads by default
+    refresh_cooldown: float = 5.0  # Seconds between manual price refreshes
     icon_file: str = "mine.png"
 
 
+@dataclass
+class LogView:
+    """State of one Purchase Logs window; each window tracks its own reads."""
+    text: scrolledtext.ScrolledText
+    status: ttk.Label
+    offset: int = 0  # Bytes of the log already shown
+    key: Optional[Tuple[str, int, int]] = None  # (path, mtime_ns, size) last shown
+    future: Optional[Future] = None  # Read currently running on the IO pool
+
+
+def _read_log_tail(path: str, tail_bytes: Optional[int]) -> Tuple[str, bool, int]:
+    """Read a log file, or just its last ``tail_bytes``.
+    
+    Returns (text, truncated, offset just past the last complete line read).
+    """
+    with open(path, 'rb', buffering=1024 * 1024) as f:
+        size = os.fstat(f.fileno()).st_size
+        truncated = tail_bytes is not None and size > tail_bytes
+        start = 0
+        if truncated:
+            f.seek(size - tail_bytes)
+            f.readline()  # Drop the partial first line
+            start = f.tell()
+        raw = f.read()
+    raw = raw[:raw.rfind(b"\n") + 1]  # Leave a partially written line for next time
+    return raw.decode('utf-8', errors='replace'), truncated, start + len(raw)
+
+
+@lru_cache(maxsize=4)
+def _read_log_tail_cached(path: str, mtime_ns: int, size: int, tail_bytes: int) -> Tuple[str, bool, int]:
+    """Memoized tail read; any write changes mtime/size and so the cache key."""
+    return _read_log_tail(path, tail_bytes)
+
+
 class Logger:
     """Centralized logging class."""
     
@@ -52,19 +95,36 @@ class Logger:
     
     def setup_logging(self):
         """Setup logging configuration."""
+        log_format = '%(asctime)s - %(levelname)s - %(message)s'
+        
+        # The memory handler never formats records itself, so the file handler needs its own formatter
+        file_handler = logging.FileHandler(self.log_file)
+        file_handler.setFormatter(logging.Formatter(log_format))
+        
+        # Buffer file writes; errors (and explicit flushes) push them to disk
+        self.memory_handler = logging.handlers.MemoryHandler(
+            capacity=256,
+            flushLevel=logging.ERROR,
+            target=file_handler
+        )
         logging.basicConfig(
             level=logging.INFO,
-            format='%(asctime)s - %(levelname)s - %(message)s',
+            format=log_format,
             handlers=[
-                logging.FileHandler(self.log_file),
+                self.memory_handler,
                 logging.StreamHandler(sys.stdout)
             ]
         )
         self.logger = logging.getLogger(__name__)
     
+    def flush(self):
+        """Write any buffered records to the log file."""
+        self.memory_handler.flush()
+    
     def log_purchase(self, message: str):
         """Log a purchase with timestamp."""
         self.logger.info(f"PURCHASE: {message}")
+        self.flush()  # Orders go to disk immediately
     
     def log_error(self, message: str):
         """Log an error."""
@@ -73,75 +133,118 @@ class Logger:
     def log_info(self, message: str):
         """Log general information."""
         self.logger.info(message)
+    
+    def log_debug(self, message: str, *args):
+        """Log debug detail; %-style args are only formatted if DEBUG is enabled."""
+        self.logger.debug(message, *args)
 
 
 class PriceManager:
     """Manages price fetching and caching."""
     
-    def __init__(self, config: Config, logger: Logger, app_instance=None):
+    def __init__(self, config: Config, logger: Logger, app_instance=None,
+                 session: Optional[requests.Session] = None):
         self.config = config
         self.logger = logger
         self.app_instance = app_instance
+        self.session = session or requests.Session()
         self.prices: Dict[str, int] = {}
-        self.last_fetch: Optional[datetime] = None
+        self._prices_view: Mapping[str, int] = MappingProxyType(self.prices)
+        self._price_stats: Tuple[int, int, int] = (0, 0, 0)
+        self.last_fetch: Optional[datetime] = None  # Wall-clock time, for display
+        self._last_fetch_monotonic: float = 0.0  # For cache freshness checks
         self.cache_duration = 300  # 5 minutes in seconds
+        self.pandas_min_items = 1000  # Catalog size at which pandas parsing pays off
+        self._etag: Optional[str] = None  # Validators of the response behind self.prices
+        self._last_modified: Optional[str] = None
+        self.cache_file = Path(config.cache_file)
+        self._load_disk_cache()
+    
+    def _load_disk_cache(self):
+        """Load prices saved by a previous run if they are still fresh."""
+        if not self.cache_file.exists():
+            return
+        try:
+            with open(self.cache_file, 'r') as f:
+                cached = json.load(f)
+            if cached.get("sheet_id") != self.config.sheet_id:
+                return
+            saved_ts = datetime.fromisoformat(cached["ts"])
+            age = (datetime.now() - saved_ts).total_seconds()
+            if 0 <= age < self.cache_duration:
+                self._set_prices({name: int(price) for name, price in cached["prices"].items()})
+                self.last_fetch = saved_ts
+                self._last_fetch_monotonic = time.monotonic() - age
+                self._etag = cached.get("etag")
+                self._last_modified = cached.get("last_modified")
+                self.logger.log_info(f"Loaded {len(self.prices)} cached prices from disk")
+        except Exception as e:
+            self.logger.log_error(f"Error loading price cache: {e}")
     
-    def fetch_prices_from_sheet(self) -> bool:
-        """Fetch prices from Google Sheets with caching."""
+    def _save_disk_cache(self):
+        """Persist the current prices so a restart can skip the network."""
+        try:
+            with open(self.cache_file, 'w') as f:
+                json.dump({
+                    "sheet_id": self.config.sheet_id,
+                    "ts": self.last_fetch.isoformat(),
+                    "prices": self.prices,
+                    "etag": self._etag,
+                    "last_modified": self._last_modified
+                }, f)
+        except Exception as e:
+            self.logger.log_error(f"Error saving price cache: {e}")
+    
+    def fetch_prices_from_sheet(self, on_progress: Optional[Callable[[str], None]] = None) -> bool:
+        """Fetch prices from Google Sheets with caching.
+        
+        ``on_progress`` is called with a status message when the download
+        starts being parsed; it runs on the calling thread.
+        """
         try:
             # Check if we have recent cached data
-            if (self.last_fetch and 
-                (datetime.now() - self.last_fetch).seconds < self.cache_duration and 
-                self.prices):
+            if self.prices and (time.monotonic() - self._last_fetch_monotonic) < self.cache_duration:
                 self.logger.log_info("Using cached prices")
                 return True
             
             url = f"https://docs.google.com/spreadsheets/d/{self.config.sheet_id}/export?format=csv"
-            response = requests.get(url, timeout=10)
-            response.raise_for_status()
-            
-            f = StringIO(response.text)
-            lines = f.readlines()
-            
-            # Skip first 1 row (row 1), start from row 2 (index 1)
-            # This will include Diamond as the first item
-            if len(lines) < 2:
-                raise ValueError("Sheet doesn't have enough rows")
+            headers = {}
+            if self.prices:  # A 304 is only useful when there is something to keep
+                if self._etag:
+                    headers["If-None-Match"] = self._etag
+                if self._last_modified:
+                    headers["If-Modified-Since"] = self._last_modified
             
-            # Read from row 2 onwards (includes Diamond)
-            csv_content = ''.join(lines[1:])  # Skip first 1 row
-            reader = csv.DictReader(StringIO(csv_content))
-            
-            # Debug: print available columns
-            if reader.fieldnames:
-                self.logger.log_info(f"Available columns: {reader.fieldnames}")
-            
-            new_prices = {}
-            for i, row in enumerate(reader):
-                # Debug: print each row
-                self.logger.log_info(f"Row {i+3}: {row}")
+            with self.session.get(url, headers=headers, stream=True, timeout=10) as response:
+                if response.status_code == 304:
+                    # Sheet unchanged: keep the same price dict so callers can skip work
+                    self.last_fetch = datetime.now()
+                    self._last_fetch_monotonic = time.monotonic()
+                    self._save_disk_cache()  # Restamp so a restart still trusts the cache
+                    self.logger.log_info("Prices not modified since last fetch")
+                    return True
+                
+                response.raise_for_status()
+                etag = response.headers.get("ETag")
+                last_modified = response.headers.get("Last-Modified")
+                if response.encoding is None:
+                    response.encoding = "utf-8"
+                if on_progress:
+                    on_progress("Reading price data...")
                 
-                columns = list(row.keys())
-                if len(columns) >= 3:
-                    # Column A (first column): Item name
-                    # Column C (third column): AdjustedPrice
-                    item_name = row[columns[0]]  # First column (A) - item name
-                    adjusted_price = row[columns[2]]  # Third column (C) - adjusted price
-                    
-                    # Skip empty item names
-                    if item_name and item_name.strip():
-                        try:
-                            new_prices[item_name.strip()] = int(adjusted_price)
-                            self.logger.log_info(f"Added price: {item_name.strip()} = {adjusted_price}")
-                        except ValueError:
-                            self.logger.log_error(f"Invalid price for {item_name}: {adjusted_price}")
-                            continue
+                # Large catalogs go through pandas' C parser when it is installed
+                if PANDAS_AVAILABLE and len(self.prices) >= self.pandas_min_items:
+                    new_prices = self._parse_with_pandas(response)
                 else:
-                    self.logger.log_error(f"Not enough columns in row: {row}")
+                    # Parse lines as they arrive instead of buffering the whole body
+                    new_prices = self._parse_rows(response.iter_lines(decode_unicode=True))
             
             if new_prices:
-                self.prices = new_prices
+                self._set_prices(new_prices)
+                self._etag, self._last_modified = etag, last_modified
                 self.last_fetch = datetime.now()
+                self._last_fetch_monotonic = time.monotonic()
+                self._save_disk_cache()
                 self.logger.log_info(f"Prices fetched successfully: {len(self.prices)} items")
                 return True
             else:
@@ -149,19 +252,82 @@ class PriceManager:
                 
         except requests.exceptions.RequestException as e:
             self.logger.log_error(f"Error fetching sheet: {e}")
-            if self.app_instance and hasattr(self.app_instance, '_show_error_window'):
-                self.app_instance._show_error_window(f"Failed to fetch prices from Google Sheets:\n{e}")
-            elif self.app_instance and hasattr(self.app_instance, 'root'):
-                messagebox.showerror("Error", f"Failed to fetch prices from Google Sheets:\n{e}")
+            self._report_error(f"Failed to fetch prices from Google Sheets:\n{e}")
             return False
         except Exception as e:
             self.logger.log_error(f"Unexpected error fetching prices: {e}")
-            if self.app_instance and hasattr(self.app_instance, '_show_error_window'):
-                self.app_instance._show_error_window(f"Unexpected error fetching prices:\n{e}")
-            elif self.app_instance and hasattr(self.app_instance, 'root'):
-                messagebox.showerror("Error", f"Unexpected error fetching prices:\n{e}")
+            self._report_error(f"Unexpected error fetching prices:\n{e}")
             return False
     
+    def _parse_rows(self, line_iter) -> Dict[str, int]:
+        """Parse sheet lines with the csv module, reading columns A and C."""
+        # Skip first 1 row (row 1), start from row 2 (index 1)
+        # This will include Diamond as the first item
+        if next(line_iter, None) is None:
+            raise ValueError("Sheet doesn't have enough rows")
+        
+        # Read from row 2 onwards (includes Diamond); row 2 holds the column headers
+        reader = csv.reader(line_iter)
+        header = next(reader, None)
+        
+        # Debug: print available columns
+        if header:
+            self.logger.log_info(f"Available columns: {header}")
+        
+        new_prices = {}
+        for i, row in enumerate(reader):
+            # Debug: print each row
+            self.logger.log_debug("Row %d: %r", i + 3, row)
+            
+            if not row:
+                continue  # Blank line (iter_lines can also split a \r\n pair into one)
+            if len(row) >= 3:
+                # Column A (first column): Item name
+                # Column C (third column): AdjustedPrice
+                item_name = row[0].strip()
+                adjusted_price = row[2]
+                
+                # Skip empty item names
+                if item_name:
+                    try:
+                        new_prices[item_name] = int(adjusted_price)
+                        self.logger.log_debug("Added price: %s = %s", item_name, adjusted_price)
+                    except ValueError:
+                        self.logger.log_error(f"Invalid price for {item_name}: {adjusted_price}")
+                        continue
+            else:
+                self.logger.log_error(f"Not enough columns in row: {row}")
+        
+        return new_prices
+    
+    def _parse_with_pandas(self, response) -> Dict[str, int]:
+        """Parse the sheet with pandas, reading only columns A and C."""
+        import pandas as pd
+        
+        response.raw.decode_content = True
+        # Skip row 1; row 2 holds the column headers
+        df = pd.read_csv(response.raw, skiprows=1, header=0, usecols=[0, 2],
+                         dtype=str, keep_default_na=False, encoding=response.encoding)
+        self.logger.log_info(f"Available columns: {list(df.columns)}")
+        
+        names = df.iloc[:, 0].fillna("").str.strip()
+        prices = df.iloc[:, 1].fillna("").str.strip()
+        named = names != ""
+        valid = named & prices.str.fullmatch(r"[+-]?\d+")
+        
+        invalid_count = int((named & ~valid).sum())
+        if invalid_count:
+            self.logger.log_error(f"Skipped {invalid_count} rows with invalid prices")
+        
+        return dict(zip(names[valid].tolist(), prices[valid].astype("int64").tolist()))
+    
+    def _report_error(self, error_message: str):
+        """Show a fetch error on the Tk thread (fetches may run on a worker thread)."""
+        if self.app_instance and hasattr(self.app_instance, '_show_error_window'):
+            self.app_instance._post_to_tk(self.app_instance._show_error_window, error_message)
+        elif self.app_instance and getattr(self.app_instance, 'root', None):
+            self.app_instance._post_to_tk(messagebox.showerror, "Error", error_message)
+    
     def _show_error_window(self, error_message: str):
         """Show an error window when prices can't be fetched."""
         error_window = tk.Toplevel()
@@ -210,33 +376,119 @@ class PriceManager:
         """Get price for an item."""
         return self.prices.get(item, 0)
     
-    def get_all_prices(self) -> Dict[str, int]:
-        """Get all prices."""
-        return self.prices.copy()
+    def _set_prices(self, new_prices: Dict[str, int]):
+        """Replace the price table and recompute the cached view and stats."""
+        self.prices = new_prices
+        self._prices_view = MappingProxyType(new_prices)
+        if new_prices:
+            values = new_prices.values()
+            self._price_stats = (len(new_prices), min(values), max(values))
+        else:
+            self._price_stats = (0, 0, 0)
+    
+    def get_all_prices(self) -> Mapping[str, int]:
+        """Get a read-only view of all prices."""
+        return self._prices_view
+    
+    def get_price_stats(self) -> Tuple[int, int, int]:
+        """Get (item count, min price, max price) for the current prices."""
+        return self._price_stats
 
 
 class DiscordNotifier:
     """Handles Discord notifications."""
     
-    def __init__(self, config: Config, logger: Logger):
+    def __init__(self, config: Config, logger: Logger, session: Optional[requests.Session] = None):
         self.config = config
         self.logger = logger
-        self.enabled = DISCORD_AVAILABLE and bool(config.discord_webhook_url)
+        self.session = session or requests.Session()
+        self.enabled = bool(config.discord_webhook_url)
+        self.pending_file = Path(config.pending_file)
+        self._q: queue.Queue = queue.Queue()
+        self._lock = threading.Lock()
+        self._inflight: Optional[str] = None
+        self._failed: List[str] = []
+        if self.enabled:
+            self._load_pending()
+            threading.Thread(target=self._worker, daemon=True).start()
     
     def send_message(self, message: str) -> bool:
-        """Send a message to Discord."""
+        """Queue a message for Discord; returns True once it is queued."""
         if not self.enabled:
             self.logger.log_info("Discord integration disabled")
             return False
         
+        self._q.put(message)
+        return True
+    
+    def _worker(self):
+        """Deliver queued messages to Discord one at a time."""
+        while True:
+            message = self._q.get()
+            with self._lock:
+                self._inflight = message
+            try:
+                # Post the webhook payload directly so it shares the pooled connection
+                response = self.session.post(self.config.discord_webhook_url,
+                                             json={"content": message}, timeout=10)
+                response.raise_for_status()
+                self.logger.log_info("Message sent to Discord successfully")
+            except Exception as e:
+                self.logger.log_error(f"Failed to send Discord message: {e}")
+                with self._lock:
+                    self._failed.append(message)  # Retried on the next start
+            finally:
+                with self._lock:
+                    self._inflight = None
+                self._q.task_done()
+    
+    def close(self, timeout: float = 2.0):
+        """Give queued messages a moment to go out, then persist whatever is left."""
+        deadline = time.monotonic() + timeout
+        while time.monotonic() < deadline:
+            with self._lock:
+                busy = self._inflight is not None
+            if not busy and self._q.empty():
+                break
+            time.sleep(0.05)
+        self.save_pending()
+    
+    def save_pending(self):
+        """Move failed, in-flight and queued messages to the pending file."""
+        with self._lock:
+            pending, self._failed = self._failed, []
+            if self._inflight is not None:
+                pending.append(self._inflight)
+        # Take queued messages out so this notifier's worker won't send them too
+        while True:
+            try:
+                pending.append(self._q.get_nowait())
+            except queue.Empty:
+                break
+            self._q.task_done()
+        if not pending:
+            return
         try:
-            webhook = DiscordWebhook(url=self.config.discord_webhook_url, content=message)
-            webhook.execute()
-            self.logger.log_info("Message sent to Discord successfully")
-            return True
+            with open(self.pending_file, 'w') as f:
+                json.dump(pending, f)
+            self.logger.log_info(f"Saved {len(pending)} undelivered Discord messages")
         except Exception as e:
-            self.logger.log_error(f"Failed to send Discord message: {e}")
-            return False
+            self.logger.log_error(f"Error saving pending Discord messages: {e}")
+    
+    def _load_pending(self):
+        """Re-queue messages a previous run could not deliver."""
+        try:
+            with open(self.pending_file, 'r') as f:
+                pending = json.load(f)
+            self.pending_file.unlink()
+        except FileNotFoundError:
+            return
+        except Exception as e:
+            self.logger.log_error(f"Error loading pending Discord messages: {e}")
+            return
+        for message in pending:
+            self._q.put(message)
+        self.logger.log_info(f"Re-queued {len(pending)} undelivered Discord messages")
 
 
 class MinecraftShopApp:
@@ -245,19 +497,37 @@ class MinecraftShopApp:
     def __init__(self):
         self.config = Config()
         self.logger = Logger(self.config.log_file)
-        self.price_manager = PriceManager(self.config, self.logger, self)
-        self.discord_notifier = DiscordNotifier(self.config, self.logger)
+        self._load_config()  # Before the managers, so they see the saved sheet/webhook
+        self.session = requests.Session()  # Shared keep-alive pool for Sheets and Discord
+        self.price_manager = PriceManager(self.config, self.logger, self, self.session)
+        self.discord_notifier = DiscordNotifier(self.config, self.logger, self.session)
         
         self.root = None
         self.shop_window = None
         self.player_name = None
         self.selected_item = None
-        self.item_buttons: List[tk.Button] = []
+        self._item_btn_by_name: Dict[str, tk.Button] = {}  # Item name -> button, in grid order
+        self._last_prices: Dict[str, int] = {}  # Prices the item buttons currently show
+        self._items_frame = None
+        self._selected_btn: Optional[tk.Button] = None
         self.quantity_entry = None
         self.total_label = None
         self.status_label = None
+        self._orders_today_count = 0
+        self._icon_img = None
+        self._stats_dirty = False
+        self._fonts: Dict[str, tkfont.Font] = {}
+        self._screen_size = (0, 0)  # Cached once the root window exists
+        self._io_pool = ThreadPoolExecutor(max_workers=1)  # Log file reads
+        self._pending_afters: set = set()  # Ids from _after/_after_idle not yet fired
+        self._closing = False  # Set by _quit so worker threads stop posting to Tk
+        self._quit_dialog: Optional[tk.Toplevel] = None
+        self._refreshing_prices = False
+        self._last_refresh = 0.0  # time.monotonic() of the last successful refresh
+        self._settings_window: Optional[tk.Toplevel] = None
+        self._webhook_entry = None
+        self._sheet_entry = None
         
-        self._load_config()
         self._setup_ui()
     
     def _load_config(self):
@@ -289,6 +559,8 @@ class MinecraftShopApp:
     def _setup_ui(self):
         """Setup the main UI."""
         self.root = tk.Tk()
+        self._create_fonts()
+        self._screen_size = (self.root.winfo_screenwidth(), self.root.winfo_screenheight())
         self.root.title("Minecraft Shop - Login")
         self.root.geometry("400x200")
         self.root.resizable(False, False)
@@ -297,14 +569,9 @@ class MinecraftShopApp:
         self.player_name = tk.StringVar()
         
         # Set icon if available
-        if PIL_AVAILABLE:
-            try:
-                icon_path = self._resource_path(self.config.icon_file)
-                if os.path.exists(icon_path):
-                    icon_img = ImageTk.PhotoImage(Image.open(icon_path))
-                    self.root.iconphoto(False, icon_img)
-            except Exception as e:
-                self.logger.log_error(f"Error loading icon: {e}")
+        self._load_icon()
+        if self._icon_img:
+            self.root.iconphoto(False, self._icon_img)
         
         # Center the window
         self._center_window(self.root)
@@ -313,11 +580,11 @@ class MinecraftShopApp:
         login_frame = ttk.Frame(self.root, padding="20")
         login_frame.pack(expand=True, fill="both")
         
-        ttk.Label(login_frame, text="Minecraft Shop", font=("Arial", 16, "bold")).pack(pady=(0, 20))
+        ttk.Label(login_frame, text="Minecraft Shop", font=self._fonts["title"]).pack(pady=(0, 20))
         
-        ttk.Label(login_frame, text="Enter your player name:", font=("Arial", 12)).pack(pady=(0, 10))
+        ttk.Label(login_frame, text="Enter your player name:", font=self._fonts["body"]).pack(pady=(0, 10))
         
-        name_entry = ttk.Entry(login_frame, textvariable=self.player_name, font=("Arial", 12), width=30)
+        name_entry = ttk.Entry(login_frame, textvariable=self.player_name, font=self._fonts["body"], width=30)
         name_entry.pack(pady=(0, 20))
         name_entry.focus()
         
@@ -339,6 +606,56 @@ class MinecraftShopApp:
         self.status_label = ttk.Label(login_frame, text="", foreground="blue")
         self.status_label.pack(pady=(10, 0))
     
+    def _create_fonts(self):
+        """Create the named fonts shared by every window (needs the root window)."""
+        self._fonts = {
+            "title": tkfont.Font(self.root, family="Arial", size=16, weight="bold"),
+            "body": tkfont.Font(self.root, family="Arial", size=12),
+            "body_bold": tkfont.Font(self.root, family="Arial", size=12, weight="bold"),
+            "stat_label": tkfont.Font(self.root, family="Arial", size=11, weight="bold"),
+            "stat_value": tkfont.Font(self.root, family="Arial", size=11),
+            "small": tkfont.Font(self.root, family="Arial", size=10),
+            "mono": tkfont.Font(self.root, family="Consolas", size=10),
+        }
+    
+    def _load_icon(self):
+        """Decode the window icon once so every window can reuse it."""
+        if not PIL_AVAILABLE:
+            return
+        try:
+            icon_path = self._resource_path(self.config.icon_file)
+            if os.path.exists(icon_path):
+                self._icon_img = ImageTk.PhotoImage(Image.open(icon_path))
+        except Exception as e:
+            self.logger.log_error(f"Error loading icon: {e}")
+    
+    def _after(self, ms: int, func: Callable, *args) -> str:
+        """root.after() that remembers the callback so closing can cancel it (Tk thread only)."""
+        def fire():
+            self._pending_afters.discard(after_id)
+            func(*args)
+        after_id = self.root.after(ms, fire)
+        self._pending_afters.add(after_id)
+        return after_id
+    
+    def _after_idle(self, func: Callable, *args) -> str:
+        """root.after_idle() counterpart of _after()."""
+        def fire():
+            self._pending_afters.discard(after_id)
+            func(*args)
+        after_id = self.root.after_idle(fire)
+        self._pending_afters.add(after_id)
+        return after_id
+    
+    def _post_to_tk(self, func: Callable, *args):
+        """Hand a worker thread's result to the Tk thread; dropped once the app is closing."""
+        if self._closing:
+            return
+        try:
+            self.root.after(0, func, *args)
+        except (RuntimeError, tk.TclError):
+            pass  # The root was destroyed between the check and the call
+    
     def _center_window(self, window):
         """Center a window on the screen."""
         window.update_idletasks()
@@ -348,6 +665,11 @@ class MinecraftShopApp:
         y = (window.winfo_screenheight() // 2) - (height // 2)
         window.geometry(f"{width}x{height}+{x}+{y}")
     
+    def _centered_geometry(self, width: int, height: int) -> str:
+        """Geometry string centering a fixed-size window, without a layout pass."""
+        screen_w, screen_h = self._screen_size
+        return f"{width}x{height}+{(screen_w - width) // 2}+{(screen_h - height) // 2}"
+    
     def _resource_path(self, relative_path):
         """Get resource path for bundled applications."""
         if hasattr(sys, "_MEIPASS"):
@@ -365,34 +687,42 @@ class MinecraftShopApp:
             messagebox.showerror("Error", "Player name must be at least 2 characters long")
             return
         
+        # Ignore repeated Enter presses while a fetch is already running
+        if str(self.login_button.cget("state")) == "disabled":
+            return
+        
         # Disable the login button and show loading message
         self.login_button.config(state="disabled", text="Loading...")
-        self.status_label.config(text="Please wait a moment while we fetch the latest prices...", foreground="blue")
         self.progress_bar.pack(pady=(10, 0), fill="x")  # Show progress bar
         self.progress_bar.start(10)  # Start animation
-        self.root.update()
         
-        # Show step-by-step loading messages
+        # The worker thread posts the later loading steps as they happen
         self.status_label.config(text="Connecting to Google Sheets...", foreground="blue")
-        self.root.update()
-        self.root.after(500, lambda: self._update_loading_status("Reading price data..."))
         
-        # Fetch prices in background
-        success = self.price_manager.fetch_prices_from_sheet()
+        # Fetch prices on a worker thread so the progress bar keeps animating
+        threading.Thread(target=self._bg_fetch, daemon=True).start()
+    
+    def _bg_fetch(self):
+        """Fetch prices off the Tk thread and hand the result back via after()."""
+        success = self.price_manager.fetch_prices_from_sheet(
+            on_progress=partial(self._post_to_tk, self._update_loading_status))
+        self._post_to_tk(self._on_fetch_done, success)
+    
+    def _on_fetch_done(self, success: bool):
+        """Report the login fetch result and open the shop."""
         if success:
             self.status_label.config(text="Prices loaded successfully! Opening shop...", foreground="green")
         else:
             self.status_label.config(text="Failed to load prices. Please check your connection.", foreground="red")
         
-        self.root.after(2000, self._open_shop)  # Delay to show status
+        self._after(2000, self._open_shop, success)  # Delay to show status
     
     def _update_loading_status(self, message):
         """Update the loading status message."""
         self.status_label.config(text=message, foreground="blue")
-        self.root.update()
     
-    def _open_shop(self):
-        """Open the shop window."""
+    def _open_shop(self, prices_loaded: bool = True):
+        """Open the shop window; without prices its status line says so."""
         # Stop progress bar and hide it
         self.progress_bar.stop()
         self.progress_bar.pack_forget()
@@ -404,15 +734,9 @@ class MinecraftShopApp:
         self.shop_window.geometry("375x785")
         self.shop_window.resizable(True, True)
         
-        # Set icon
-        if PIL_AVAILABLE:
-            try:
-                icon_path = self._resource_path(self.config.icon_file)
-                if os.path.exists(icon_path):
-                    icon_img = ImageTk.PhotoImage(Image.open(icon_path))
-                    self.shop_window.iconphoto(False, icon_img)
-            except Exception as e:
-                self.logger.log_error(f"Error loading icon: {e}")
+        # Set icon (decoded once in _setup_ui)
+        if self._icon_img:
+            self.shop_window.iconphoto(False, self._icon_img)
         
         self._center_window(self.shop_window)
         
@@ -420,6 +744,10 @@ class MinecraftShopApp:
         self.shop_window.protocol("WM_DELETE_WINDOW", self._on_closing)
         
         self._create_shop_ui()
+        if not prices_loaded and not self.price_manager.get_all_prices():
+            # The error dialog may sit above this window; explain the empty grid here too
+            self.status_label.config(text="Prices unavailable - click Refresh Prices to retry",
+                                     foreground="red")
     
     def _create_shop_ui(self):
         """Create the shop UI."""
@@ -433,7 +761,7 @@ class MinecraftShopApp:
         
         # Left side - Welcome message
         ttk.Label(header_frame, text=f"Welcome {self.player_name.get()}!", 
-                 font=("Arial", 16, "bold")).pack(side="left")
+                 font=self._fonts["title"]).pack(side="left")
         
         # Right side - Action buttons
         right_frame = ttk.Frame(header_frame)
@@ -453,36 +781,30 @@ class MinecraftShopApp:
         scrollbar = ttk.Scrollbar(items_frame, orient="vertical", command=canvas.yview)
         scrollable_frame = ttk.Frame(canvas)
         
-        scrollable_frame.bind(
-            "<Configure>",
-            lambda e: canvas.configure(scrollregion=canvas.bbox("all"))
-        )
+        # Recompute the scroll region once per idle pass, not on every child configure
+        scrollregion_pending = False
+        
+        def _update_scrollregion():
+            nonlocal scrollregion_pending
+            scrollregion_pending = False
+            canvas.configure(scrollregion=canvas.bbox("all"))
+        
+        def _schedule_scrollregion(event):
+            nonlocal scrollregion_pending
+            if not scrollregion_pending:
+                scrollregion_pending = True
+                self._after_idle(_update_scrollregion)
+        
+        scrollable_frame.bind("<Configure>", _schedule_scrollregion)
         
         canvas.create_window((0, 0), window=scrollable_frame, anchor="nw")
         canvas.configure(yscrollcommand=scrollbar.set)
         
         # Item buttons
-        self.item_buttons = []
-        prices = self.price_manager.get_all_prices()
-        
-        for i, (item, price) in enumerate(prices.items()):
-            row = i // 2
-            col = i % 2
-            
-            btn = tk.Button(
-                scrollable_frame,
-                text=f"{item}\n${price}",
-                command=lambda i=item, b=None: self._select_item(i, b),
-                width=15,
-                height=3,
-                font=("Arial", 10),
-                relief="raised",
-                bd=2,
-                bg="lightgray",
-                activebackground="lightblue"
-            )
-            btn.grid(row=row, column=col, padx=5, pady=5, sticky="ew")
-            self.item_buttons.append(btn)
+        self._items_frame = scrollable_frame
+        self._item_btn_by_name = {}
+        self._last_prices = {}
+        self._sync_item_buttons(self.price_manager.get_all_prices())
         
         # Configure grid weights
         scrollable_frame.grid_columnconfigure(0, weight=1)
@@ -499,15 +821,15 @@ class MinecraftShopApp:
         quantity_frame = ttk.Frame(order_frame)
         quantity_frame.pack(fill="x", pady=(0, 10))
         
-        ttk.Label(quantity_frame, text="Quantity:", font=("Arial", 12)).pack(side="left")
+        ttk.Label(quantity_frame, text="Quantity:", font=self._fonts["body"]).pack(side="left")
         
-        self.quantity_entry = ttk.Entry(quantity_frame, font=("Arial", 12), width=10)
+        self.quantity_entry = ttk.Entry(quantity_frame, font=self._fonts["body"], width=10)
         self.quantity_entry.pack(side="left", padx=(10, 0))
         self.quantity_entry.bind("<KeyRelease>", self._update_total)
         
         # Total display
         self.total_label = ttk.Label(quantity_frame, text="Total: $0", 
-                                   font=("Arial", 12, "bold"), foreground="blue")
+                                   font=self._fonts["body_bold"], foreground="blue")
         self.total_label.pack(side="right")
         
         # Buttons
@@ -532,19 +854,60 @@ class MinecraftShopApp:
         
         self._create_stats_tab(stats_frame)
     
-    def _select_item(self, item: str, button: tk.Button):
+    def _sync_item_buttons(self, prices: Mapping[str, int]):
+        """Create, update or remove item buttons so they match the given prices."""
+        if self.selected_item is not None and self.selected_item not in prices:
+            self._clear_selection()
+        
+        # Drop buttons for items that left the sheet
+        removed = [name for name in self._item_btn_by_name if name not in prices]
+        for name in removed:
+            btn = self._item_btn_by_name.pop(name)
+            btn.grid_forget()
+            btn.destroy()
+        
+        # Update kept buttons whose price changed, only building widgets for new items
+        added = False
+        get_btn = self._item_btn_by_name.get
+        get_last = self._last_prices.get
+        for item, price in prices.items():
+            btn = get_btn(item)
+            if btn is not None:
+                if get_last(item) != price:
+                    btn.config(text=f"{item}\n${price}")
+                continue
+            
+            self._item_btn_by_name[item] = tk.Button(
+                self._items_frame,
+                text=f"{item}\n${price}",
+                command=partial(self._select_item, item),
+                width=15,
+                height=3,
+                font=self._fonts["small"],
+                relief="raised",
+                bd=2,
+                bg="lightgray",
+                activebackground="lightblue"
+            )
+            added = True
+        
+        # Re-grid only when the set of items changed
+        if added or removed:
+            for i, btn in enumerate(self._item_btn_by_name.values()):
+                btn.grid(row=i // 2, column=i % 2, padx=5, pady=5, sticky="ew")
+        
+        self._last_prices = dict(prices)
+    
+    def _select_item(self, item: str):
         """Select an item for purchase."""
-        # Reset all buttons
-        for btn in self.item_buttons:
-            btn.config(relief="raised")
-            # Reset background by recreating the button style
-            btn.config(bg="lightgray", activebackground="lightblue")
+        # Reset only the previously highlighted button
+        if self._selected_btn is not None:
+            self._selected_btn.config(bg="lightgray", activebackground="lightblue", relief="raised")
         
         # Highlight selected button
-        for btn in self.item_buttons:
-            if item in btn.cget("text"):
-                btn.config(bg="lightgreen", relief="sunken")
-                break
+        btn = self._item_btn_by_name[item]
+        btn.config(bg="lightgreen", relief="sunken")
+        self._selected_btn = btn
         
         self.selected_item = item
         self._update_total()
@@ -553,10 +916,9 @@ class MinecraftShopApp:
     def _clear_selection(self):
         """Clear the current selection."""
         self.selected_item = None
-        for btn in self.item_buttons:
-            btn.config(relief="raised")
-            # Reset background by recreating the button style
-            btn.config(bg="lightgray", activebackground="lightblue")
+        if self._selected_btn is not None:
+            self._selected_btn.config(bg="lightgray", activebackground="lightblue", relief="raised")
+            self._selected_btn = None
         
         if self.quantity_entry:
             self.quantity_entry.delete(0, tk.END)
@@ -571,14 +933,21 @@ class MinecraftShopApp:
         if not self.selected_item or not self.total_label:
             return
         
-        qty_text = self.quantity_entry.get().strip()
-        if qty_text.isdigit() and int(qty_text) > 0:
-            qty = int(qty_text)
-            price = self.price_manager.get_price(self.selected_item)
-            total = price * qty
-            self.total_label.config(text=f"Total: ${total}")
-        else:
+        qty = self._parse_qty(self.quantity_entry.get().strip())
+        if qty is None:
             self.total_label.config(text="Total: $0")
+            return
+        
+        price = self.price_manager.get_price(self.selected_item)
+        self.total_label.config(text=f"Total: ${price * qty}")
+    
+    def _parse_qty(self, text: str) -> Optional[int]:
+        """Parse a quantity string, returning None unless it is a positive integer."""
+        try:
+            value = int(text)
+        except ValueError:
+            return None
+        return value if value > 0 else None
     
     def _place_order(self):
         """Place an order."""
@@ -586,12 +955,11 @@ class MinecraftShopApp:
             messagebox.showerror("Error", "Please select an item first!")
             return
         
-        qty_text = self.quantity_entry.get().strip()
-        if not qty_text.isdigit() or int(qty_text) <= 0:
+        quantity = self._parse_qty(self.quantity_entry.get().strip())
+        if quantity is None:
             messagebox.showerror("Error", "Please enter a valid quantity!")
             return
         
-        quantity = int(qty_text)
         price = self.price_manager.get_price(self.selected_item)
         total_cost = price * quantity
         
@@ -605,16 +973,17 @@ class MinecraftShopApp:
         
         # Log the purchase
         self.logger.log_purchase(f"Order: {self.player_name.get()} - {self.selected_item} x{quantity} = ${total_cost}")
+        self._orders_today_count += 1
         
         # Send to Discord
         discord_success = self.discord_notifier.send_message(message)
         
-        # Update statistics
-        self._update_stats()
+        # Update statistics once the event queue drains
+        self._mark_stats_dirty()
         
         # Show confirmation
         if discord_success:
-            messagebox.showinfo("Order Placed", "Your order has been sent to Discord!")
+            messagebox.showinfo("Order Placed", "Your order has been queued for Discord!")
             self.status_label.config(text="Order placed successfully!", foreground="green")
         else:
             messagebox.showwarning("Order Logged", "Order logged locally but Discord notification failed.")
@@ -633,11 +1002,11 @@ class MinecraftShopApp:
     def _load_recent_orders(self):
         """Load recent orders from log file."""
         try:
+            self.logger.flush()
             if os.path.exists(self.config.log_file):
                 with open(self.config.log_file, 'r') as f:
-                    lines = f.readlines()
-                    # Show last 10 orders
-                    recent_lines = lines[-10:] if len(lines) > 10 else lines
+                    # Show last 10 orders; deque keeps only the tail while streaming the file
+                    recent_lines = deque(f, maxlen=10)
                     for line in recent_lines:
                         if line.strip():
                             self._add_to_log_display(line.strip())
@@ -659,41 +1028,67 @@ class MinecraftShopApp:
         right_col.pack(side="right", fill="x", expand=True)
         
         # Left column stats
-        ttk.Label(left_col, text="Items Available:", font=("Arial", 11, "bold")).pack(anchor="w")
-        self.items_count_label = ttk.Label(left_col, text=str(len(self.price_manager.get_all_prices())), 
-                                         font=("Arial", 11), foreground="blue")
+        ttk.Label(left_col, text="Items Available:", font=self._fonts["stat_label"]).pack(anchor="w")
+        self.items_count_label = ttk.Label(left_col, text=str(self.price_manager.get_price_stats()[0]), 
+                                         font=self._fonts["stat_value"], foreground="blue")
         self.items_count_label.pack(anchor="w", pady=(0, 10))
         
-        ttk.Label(left_col, text="Orders Today:", font=("Arial", 11, "bold")).pack(anchor="w")
+        ttk.Label(left_col, text="Orders Today:", font=self._fonts["stat_label"]).pack(anchor="w")
         self.orders_today_label = ttk.Label(left_col, text="0", 
-                                          font=("Arial", 11), foreground="green")
+                                          font=self._fonts["stat_value"], foreground="green")
         self.orders_today_label.pack(anchor="w", pady=(0, 10))
         
         # Right column stats
-        ttk.Label(right_col, text="Last Price Update:", font=("Arial", 11, "bold")).pack(anchor="w")
+        ttk.Label(right_col, text="Last Price Update:", font=self._fonts["stat_label"]).pack(anchor="w")
         self.last_update_label = ttk.Label(right_col, text="Never", 
-                                         font=("Arial", 11), foreground="orange")
+                                         font=self._fonts["stat_value"], foreground="orange")
         self.last_update_label.pack(anchor="w", pady=(0, 10))
         
-        ttk.Label(right_col, text="Price Range:", font=("Arial", 11, "bold")).pack(anchor="w")
+        ttk.Label(right_col, text="Price Range:", font=self._fonts["stat_label"]).pack(anchor="w")
         self.price_range_label = ttk.Label(right_col, text="$0 - $0", 
-                                         font=("Arial", 11), foreground="purple")
+                                         font=self._fonts["stat_value"], foreground="purple")
         self.price_range_label.pack(anchor="w", pady=(0, 10))
         
+        # Seed today's order count from the log once; orders placed later increment it
+        self._orders_today_count = self._count_orders_today()
+        self._after(self._ms_until_midnight(), self._roll_daily_counter)
+        
         # Update stats
         self._update_stats()
     
+    def _ms_until_midnight(self) -> int:
+        """Milliseconds from now until the next local midnight."""
+        now = datetime.now()
+        midnight = (now + timedelta(days=1)).replace(hour=0, minute=0, second=0, microsecond=0)
+        return max(1000, int((midnight - now).total_seconds() * 1000))
+    
+    def _roll_daily_counter(self):
+        """Reset the orders-today counter at midnight and re-arm for the next day."""
+        self._orders_today_count = 0
+        self._mark_stats_dirty()
+        self._after(self._ms_until_midnight(), self._roll_daily_counter)
+    
+    def _mark_stats_dirty(self):
+        """Schedule a single statistics refresh for when Tk is next idle."""
+        if not self._stats_dirty:
+            self._stats_dirty = True
+            self._after_idle(self._flush_stats)
+    
+    def _flush_stats(self):
+        """Apply a pending statistics refresh."""
+        self._stats_dirty = False
+        self._update_stats()
     
     def _update_stats(self):
         """Update the statistics display."""
         try:
+            items_count, min_price, max_price = self.price_manager.get_price_stats()
+            
             # Update items count
-            items_count = len(self.price_manager.get_all_prices())
             self.items_count_label.config(text=str(items_count))
             
             # Update orders today
-            today_orders = self._count_orders_today()
-            self.orders_today_label.config(text=str(today_orders))
+            self.orders_today_label.config(text=str(self._orders_today_count))
             
             # Update last price update
             if self.price_manager.last_fetch:
@@ -701,10 +1096,7 @@ class MinecraftShopApp:
                 self.last_update_label.config(text=last_update)
             
             # Update price range
-            prices = list(self.price_manager.get_all_prices().values())
-            if prices:
-                min_price = min(prices)
-                max_price = max(prices)
+            if items_count:
                 self.price_range_label.config(text=f"${min_price} - ${max_price}")
             
         except Exception as e:
@@ -716,12 +1108,14 @@ class MinecraftShopApp:
             if not os.path.exists(self.config.log_file):
                 return 0
             
-            today = datetime.now().strftime("%Y-%m-%d")
+            # Log lines start with the asctime date, so a bytes prefix check is enough
+            today_bytes = datetime.now().strftime("%Y-%m-%d").encode()
+            tag = b"PURCHASE:"
             count = 0
             
-            with open(self.config.log_file, 'r') as f:
+            with open(self.config.log_file, 'rb', buffering=1024 * 1024) as f:
                 for line in f:
-                    if today in line and "PURCHASE:" in line:
+                    if line.startswith(today_bytes) and tag in line:
                         count += 1
             
             return count
@@ -733,127 +1127,373 @@ class MinecraftShopApp:
         """Open a detailed logs view window."""
         logs_window = tk.Toplevel(self.shop_window)
         logs_window.title("Purchase Logs")
-        logs_window.geometry("700x500")
+        logs_window.geometry(self._centered_geometry(700, 500))
         logs_window.resizable(True, True)
         
-        # Center the window
-        self._center_window(logs_window)
-        
         logs_frame = ttk.Frame(logs_window, padding="15")
         logs_frame.pack(fill="both", expand=True)
         
+        # Logs text area with better styling; created first so the buttons can bind it.
+        # It stays in the normal state and rejects edits through its bindings instead.
+        logs_text = scrolledtext.ScrolledText(logs_frame, height=25, 
+                                            font=self._fonts["mono"], wrap=tk.WORD)
+        logs_text.bind("<Key>", self._readonly_key)
+        for sequence in ("<<Paste>>", "<<PasteSelection>>", "<<Cut>>", "<<Clear>>"):
+            logs_text.bind(sequence, self._block_event)
+        
         # Header with title and refresh button
         header_frame = ttk.Frame(logs_frame)
         header_frame.pack(fill="x", pady=(0, 15))
         
         ttk.Label(header_frame, text="Purchase Logs", 
-                 font=("Arial", 16, "bold")).pack(side="left")
+                 font=self._fonts["title"]).pack(side="left")
+        
+        logs_status = ttk.Label(header_frame, text="", foreground="gray")
+        logs_status.pack(side="left", padx=(10, 0))
+        view = LogView(logs_text, logs_status)
         
         ttk.Button(header_frame, text="Refresh", 
-                  command=lambda: self._refresh_logs(logs_text)).pack(side="right")
+                  command=partial(self._refresh_logs, view)).pack(side="right")
+        ttk.Button(header_frame, text="Load All", 
+                  command=partial(self._refresh_logs, view, full=True)).pack(side="right", padx=(0, 5))
         
-        # Logs text area with better styling
-        logs_text = scrolledtext.ScrolledText(logs_frame, height=25, state="disabled", 
-                                            font=("Consolas", 10), wrap=tk.WORD)
         logs_text.pack(fill="both", expand=True)
         
-        # Load logs
-        self._refresh_logs(logs_text)
+        # Load logs from scratch into the new window
+        self._refresh_logs(view)
+    
+    def _refresh_logs(self, view: LogView, full: bool = False):
+        """Refresh the logs display.
+        
+        Only the last ``config.log_tail_bytes`` of the log are shown unless
+        ``full`` is set, so very large logs don't stall the UI. Later refreshes
+        append just the bytes written since the previous one. The file is read
+        on the IO pool and the result applied back on the Tk thread.
+        """
+        if view.future is not None and not view.future.done():
+            return  # A read for this window is already in flight
+        
+        view.future = self._io_pool.submit(self._load_log_update, view.offset, view.key, full)
+        self._after(50, self._poll_log_future, view)
     
-    def _refresh_logs(self, logs_text):
-        """Refresh the logs display."""
+    def _load_log_update(self, offset: int, key: Optional[Tuple[str, int, int]],
+                         full: bool) -> Tuple[str, str, int, Optional[Tuple[str, int, int]]]:
+        """Read whatever the log view needs (runs on the IO pool, no Tk calls).
+        
+        ``key`` is the (path, mtime_ns, size) of the log as last shown.
+        Returns (mode, text, new offset, new key) where mode is one of
+        "missing", "unchanged", "append", "replace" or "empty".
+        """
+        self.logger.flush()  # Show records still sitting in the memory buffer
+        
+        path = self.config.log_file
         try:
-            logs_text.config(state="normal")
-            logs_text.delete(1.0, tk.END)
-            
-            if os.path.exists(self.config.log_file):
-                with open(self.config.log_file, 'r') as f:
-                    content = f.read()
-                    if content.strip():
-                        logs_text.insert(tk.END, content)
-                    else:
-                        logs_text.insert(tk.END, "No logs found.")
-            else:
-                logs_text.insert(tk.END, "No log file found.")
-            
-            logs_text.config(state="disabled")
-            logs_text.see(tk.END)  # Scroll to bottom
+            stat = os.stat(path)
+        except FileNotFoundError:
+            return "missing", "No log file found.", 0, None
+        new_key = (path, stat.st_mtime_ns, stat.st_size)
+        
+        if not full and new_key == key:
+            return "unchanged", "", offset, key  # Nothing new since the last refresh
+        if stat.st_size == 0:
+            return "empty", "No logs found.", 0, new_key  # Nothing to open
+        
+        if (not full and key is not None and key[0] == path and 0 < offset <= stat.st_size
+                and stat.st_size - offset <= self.config.log_tail_bytes):
+            # Append only what was written since the last refresh; a bigger jump reloads the tail
+            content, offset = self._read_log_from(offset)
+            return "append", content, offset, new_key
+        
+        # First load, explicit full load, or the log was truncated/rotated
+        content, truncated, offset = self._read_log_tail_for(
+            stat, None if full else self.config.log_tail_bytes)
+        if not content.strip():
+            # Reload from scratch once something is logged
+            return "empty", "No logs found.", 0, new_key
+        
+        if truncated:
+            content = (f"... showing the last {self.config.log_tail_bytes // 1024} KB; "
+                       "click Load All for the full log ...\n\n" + content)
+        return "replace", content, offset, new_key
+    
+    def _poll_log_future(self, view: LogView):
+        """Apply a finished log read to its window, or check again shortly."""
+        if not view.future.done():
+            self._after(50, self._poll_log_future, view)
+            return
+        logs_text = view.text
+        if not logs_text.winfo_exists():
+            return  # The logs window was closed while reading
+        
+        try:
+            mode, content, view.offset, view.key = view.future.result()
         except Exception as e:
-            logs_text.config(state="normal")
             logs_text.insert(tk.END, f"Error loading logs: {e}")
-            logs_text.config(state="disabled")
+            return
+        
+        if mode == "append":
+            if content:
+                self._insert_log_chunks(logs_text, content)
+                logs_text.see(tk.END)
+        elif mode == "unchanged":
+            self._flash_logs_status(view.status, "No new entries")  # Leave the text widget untouched
+        else:
+            self._replace_log_text(logs_text, content)
     
-    def _refresh_prices(self):
-        """Refresh prices from the sheet."""
-        self.status_label.config(text="Refreshing prices...", foreground="blue")
-        self.shop_window.update()
+    def _flash_logs_status(self, label, message: str, duration_ms: int = 1500):
+        """Show a short-lived message next to a logs window title."""
+        if not label.winfo_exists():
+            return
+        label.config(text=message)
+        self._after(duration_ms, self._clear_logs_status, label)
+    
+    def _clear_logs_status(self, label):
+        """Clear a flashed logs window message if the window is still open."""
+        if label.winfo_exists():
+            label.config(text="")
+    
+    # Keys a read-only text view still lets through: navigation and copy/select-all
+    _READONLY_NAV_KEYS = frozenset(("Up", "Down", "Left", "Right", "Prior", "Next", "Home", "End"))
+    
+    def _readonly_key(self, event):
+        """Reject typing in the logs view while keeping navigation and copying."""
+        if event.keysym in self._READONLY_NAV_KEYS:
+            return None
+        if event.state & 0x4 and event.keysym.lower() in ("c", "a"):  # Control held
+            return None
+        return "break"
+    
+    def _block_event(self, event):
+        """Swallow an editing virtual event."""
+        return "break"
+    
+    def _replace_log_text(self, logs_text, content: str):
+        """Replace the log view's contents and scroll to the bottom."""
+        logs_text.delete(1.0, tk.END)
+        self._insert_log_chunks(logs_text, content)
+        logs_text.see(tk.END)  # Scroll to bottom
+    
+    def _insert_log_chunks(self, logs_text, content: str, chunk_size: int = 64 * 1024):
+        """Insert text in 64 KB slices so large logs render progressively."""
+        # Detach the scrollbar so it isn't recomputed after every slice
+        logs_text.configure(yscrollcommand="")
+        try:
+            for start in range(0, len(content), chunk_size):
+                logs_text.insert(tk.END, content[start:start + chunk_size])
+                self.root.update_idletasks()
+        finally:
+            logs_text.configure(yscrollcommand=logs_text.vbar.set)
+    
+    def _read_log_tail_for(self, stat: os.stat_result, tail_bytes: Optional[int]) -> Tuple[str, bool, int]:
+        """Read the log, or just its last ``tail_bytes``.
+        
+        Returns (text, truncated, offset just past the last complete line read).
+        Tail reads are memoized on the file's mtime and size.
+        """
+        if tail_bytes is None:
+            return _read_log_tail(self.config.log_file, None)
+        return _read_log_tail_cached(self.config.log_file, stat.st_mtime_ns, stat.st_size, tail_bytes)
+    
+    def _read_log_from(self, offset: int) -> Tuple[str, int]:
+        """Read complete lines written after ``offset``; returns (text, new offset)."""
+        with open(self.config.log_file, 'rb', buffering=1024 * 1024) as f:
+            f.seek(offset)
+            raw = f.read()
+        raw = raw[:raw.rfind(b"\n") + 1]
+        return raw.decode('utf-8', errors='replace'), offset + len(raw)
+    
+    def _refresh_prices(self, force: bool = False):
+        """Refresh prices from the sheet.
+        
+        ``force`` skips the in-flight and cooldown checks; it is used when the
+        sheet changed and any running fetch is for the old one.
+        """
+        # Ignore clicks while a refresh is running or right after one finished
+        if not force and (self._refreshing_prices
+                          or time.monotonic() - self._last_refresh < self.config.refresh_cooldown):
+            return
         
-        success = self.price_manager.fetch_prices_from_sheet()
+        self.status_label.config(text="Refreshing prices...", foreground="blue")
+        self._refreshing_prices = True
+        manager = self.price_manager
+        previous = manager.get_all_prices()
+        threading.Thread(target=self._do_fetch, args=(manager, previous), daemon=True).start()
+    
+    def _do_fetch(self, manager: PriceManager, previous: Mapping[str, int]):
+        """Fetch prices off the Tk thread and hand the result back via after()."""
+        success = False
+        try:
+            success = manager.fetch_prices_from_sheet()
+        finally:
+            self._post_to_tk(self._apply_fetched_prices, manager, success, previous)
+    
+    def _apply_fetched_prices(self, manager: PriceManager, success: bool, previous: Mapping[str, int]):
+        """Apply a finished price refresh to the shop window."""
+        if manager is not self.price_manager:
+            return  # Fetched for a sheet that has since been replaced in settings
+        self._refreshing_prices = False
+        if not self.shop_window or not self.shop_window.winfo_exists():
+            return
         
-        if success:
-            # Update button texts
-            prices = self.price_manager.get_all_prices()
-            for btn in self.item_buttons:
-                # Extract item name from button text
-                current_text = btn.cget("text")
-                if "\n" in current_text:
-                    item_name = current_text.split("\n")[0]
-                    if item_name in prices:
-                        btn.config(text=f"{item_name}\n${prices[item_name]}")
+        if success and manager.get_all_prices() is previous:
+            # Cached or 304 Not Modified: the price table object didn't change
+            self._last_refresh = time.monotonic()
+            self.status_label.config(text="Prices up to date", foreground="green")
+        elif success:
+            self._last_refresh = time.monotonic()
+            # Update, add or remove item buttons to match the new prices
+            self._sync_item_buttons(manager.get_all_prices())
             
             self._update_total()
-            self._update_stats()  # Update statistics
+            self._mark_stats_dirty()  # Update statistics
             self.status_label.config(text="Prices refreshed successfully!", foreground="green")
         else:
             self.status_label.config(text="Failed to refresh prices", foreground="red")
     
     def _open_settings(self):
-        """Open settings window."""
+        """Open settings window, building it on first use."""
+        if self._settings_window is not None and self._settings_window.winfo_exists():
+            self._fill_settings_entries()
+            self._settings_window.deiconify()
+            self._settings_window.lift()
+            self._settings_window.grab_set()
+            return
+        
         settings_window = tk.Toplevel(self.root)
         settings_window.title("Settings")
-        settings_window.geometry("400x300")
+        settings_window.geometry(self._centered_geometry(400, 300))
         settings_window.resizable(False, False)
         settings_window.transient(self.root)
         settings_window.grab_set()
-        
-        # Center the settings window
-        self._center_window(settings_window)
+        settings_window.protocol("WM_DELETE_WINDOW", self._hide_settings)
+        self._settings_window = settings_window
         
         settings_frame = ttk.Frame(settings_window, padding="20")
         settings_frame.pack(expand=True, fill="both")
         
         # Discord webhook URL
-        ttk.Label(settings_frame, text="Discord Webhook URL:", font=("Arial", 12)).pack(anchor="w", pady=(0, 5))
-        webhook_entry = ttk.Entry(settings_frame, width=50, font=("Arial", 10))
-        webhook_entry.insert(0, self.config.discord_webhook_url)
-        webhook_entry.pack(fill="x", pady=(0, 15))
+        ttk.Label(settings_frame, text="Discord Webhook URL:", font=self._fonts["body"]).pack(anchor="w", pady=(0, 5))
+        self._webhook_entry = ttk.Entry(settings_frame, width=50, font=self._fonts["small"])
+        self._webhook_entry.pack(fill="x", pady=(0, 15))
         
         # Google Sheet ID
-        ttk.Label(settings_frame, text="Google Sheet ID:", font=("Arial", 12)).pack(anchor="w", pady=(0, 5))
-        sheet_entry = ttk.Entry(settings_frame, width=50, font=("Arial", 10))
-        sheet_entry.insert(0, self.config.sheet_id)
-        sheet_entry.pack(fill="x", pady=(0, 20))
+        ttk.Label(settings_frame, text="Google Sheet ID:", font=self._fonts["body"]).pack(anchor="w", pady=(0, 5))
+        self._sheet_entry = ttk.Entry(settings_frame, width=50, font=self._fonts["small"])
+        self._sheet_entry.pack(fill="x", pady=(0, 20))
+        
+        self._fill_settings_entries()
         
         # Buttons
         button_frame = ttk.Frame(settings_frame)
         button_frame.pack(fill="x")
         
-        def save_settings():
-            self.config.discord_webhook_url = webhook_entry.get().strip()
-            self.config.sheet_id = sheet_entry.get().strip()
-            self._save_config()
-            self.discord_notifier = DiscordNotifier(self.config, self.logger)
-            messagebox.showinfo("Settings", "Settings saved successfully!")
-            settings_window.destroy()
-        
-        ttk.Button(button_frame, text="Save", command=save_settings).pack(side="left", padx=(0, 10))
-        ttk.Button(button_frame, text="Cancel", command=settings_window.destroy).pack(side="left")
+        ttk.Button(button_frame, text="Save", command=self._save_settings).pack(side="left", padx=(0, 10))
+        ttk.Button(button_frame, text="Cancel", command=self._hide_settings).pack(side="left")
+    
+    def _fill_settings_entries(self):
+        """Load the current configuration into the settings entries."""
+        self._webhook_entry.delete(0, tk.END)
+        self._webhook_entry.insert(0, self.config.discord_webhook_url)
+        self._sheet_entry.delete(0, tk.END)
+        self._sheet_entry.insert(0, self.config.sheet_id)
+    
+    def _hide_settings(self):
+        """Hide the settings window so the next open can reuse it."""
+        self._settings_window.grab_release()
+        self._settings_window.withdraw()
+    
+    def _save_settings(self):
+        """Save the settings entered in the settings window."""
+        old_url, old_sheet = self.config.discord_webhook_url, self.config.sheet_id
+        self.config.discord_webhook_url = self._webhook_entry.get().strip()
+        self.config.sheet_id = self._sheet_entry.get().strip()
+        self._save_config()
+        
+        # Only rebuild what the change affects; the shared session stays warm
+        if self.config.discord_webhook_url != old_url:
+            self.discord_notifier.save_pending()  # The new notifier picks these up
+            self.discord_notifier = DiscordNotifier(self.config, self.logger, self.session)
+        if self.config.sheet_id != old_sheet:
+            self.price_manager = PriceManager(self.config, self.logger, self, self.session)
+            if self.shop_window is not None and self.shop_window.winfo_exists():
+                self._refresh_prices(force=True)  # Even if the old sheet is still being fetched
+        self._hide_settings()
+        self._confirm("Settings", "Settings saved successfully!", show_cancel=False)
+    
+    def _confirm(self, title: str, message: str, on_ok: Optional[Callable[[], None]] = None,
+                 show_cancel: bool = True) -> tk.Toplevel:
+        """Show a modal OK/Cancel dialog without blocking the event loop.
+        
+        Unlike messagebox this returns immediately; ``on_ok`` is called once
+        the user clicks OK.
+        """
+        parent = self.shop_window if self.shop_window and self.shop_window.winfo_exists() else self.root
+        dialog = tk.Toplevel(parent)
+        dialog.title(title)
+        dialog.geometry(self._centered_geometry(320, 130))
+        dialog.resizable(False, False)
+        dialog.transient(parent)
+        
+        dialog_frame = ttk.Frame(dialog, padding="15")
+        dialog_frame.pack(expand=True, fill="both")
+        ttk.Label(dialog_frame, text=message, font=self._fonts["body"], wraplength=280).pack(pady=(0, 15))
+        
+        button_frame = ttk.Frame(dialog_frame)
+        button_frame.pack()
+        ok = partial(self._close_confirm, dialog, on_ok)
+        cancel = partial(self._close_confirm, dialog, None)
+        ttk.Button(button_frame, text="OK", command=ok).pack(side="left", padx=(0, 10) if show_cancel else 0)
+        if show_cancel:
+            ttk.Button(button_frame, text="Cancel", command=cancel).pack(side="left")
+        
+        dialog.protocol("WM_DELETE_WINDOW", cancel)
+        dialog.bind("<Return>", partial(self._confirm_return, ok))
+        dialog.bind("<Escape>", partial(self._confirm_key, cancel))
+        dialog.grab_set()
+        dialog.focus_set()
+        return dialog
+    
+    def _confirm_return(self, ok: Callable[[], None], event):
+        """Enter presses the focused dialog button, or OK when no button has focus."""
+        if isinstance(event.widget, ttk.Button):
+            event.widget.invoke()
+        else:
+            ok()
+        return "break"
+    
+    def _confirm_key(self, action: Callable[[], None], event):
+        """Run a _confirm button action from a key binding."""
+        action()
+        return "break"
+    
+    def _close_confirm(self, dialog, callback: Optional[Callable[[], None]]):
+        """Close a _confirm dialog and run the chosen callback, if any."""
+        dialog.grab_release()
+        dialog.destroy()
+        if callback:
+            callback()
     
     def _on_closing(self):
         """Handle application closing."""
-        if messagebox.askokcancel("Quit", "Do you want to quit the application?"):
-            self.shop_window.destroy()
-            self.root.destroy()
+        if self._quit_dialog is not None and self._quit_dialog.winfo_exists():
+            self._quit_dialog.lift()  # Already asking; don't stack another dialog
+            self._quit_dialog.focus_set()
+            return
+        self._quit_dialog = self._confirm("Quit", "Do you want to quit the application?", on_ok=self._quit)
+    
+    def _quit(self):
+        """Tear down timers, the IO pool and the windows."""
+        self._closing = True
+        # Drop timers and queued log reads so nothing fires into destroyed widgets
+        for after_id in self._pending_afters:
+            self.root.after_cancel(after_id)
+        self._pending_afters.clear()
+        self._io_pool.shutdown(wait=False, cancel_futures=True)
+        self.discord_notifier.close()  # Keep orders that haven't reached Discord yet
+        
+        self.shop_window.destroy()
+        self.root.destroy()
+        logging.shutdown()  # Flush buffered log records
     
     def run(self):
         """Run the application."""
@@ -861,6 +1501,8 @@ class MinecraftShopApp:
             self.root.mainloop()
         except KeyboardInterrupt:
             self.logger.log_info("Application interrupted by user")
+            self.discord_notifier.close()
+            logging.shutdown()
         except Exception as e:
             self.logger.log_error(f"Unexpected error: {e}")
             messagebox.showerror("Error", f"An unexpected error occurred: {e}")